@@ -15,6 +15,7 @@ from aerich import Command
 from discord.ext.commands import when_mentioned_or
 from rich import print
 from tortoise import Tortoise
+from tortoise.backends.base.config_generator import expand_db_url
 
 from ballsdex import __version__ as bot_version
 from ballsdex.core.bot import BallsDexBot
@@ -24,8 +25,23 @@ from ballsdex.settings import read_settings, settings, update_settings, write_de
 discord.voice_client.VoiceClient.warn_nacl = False  # disable PyNACL warning
 log = logging.getLogger("ballsdex")
 
+
+def database_connection(db_url: str | None) -> dict | None:
+    """
+    Expand the database URL into a Tortoise connection config, with a larger connection pool
+    than the default one (1 to 5 connections) to handle bursts of commands. The pool size can
+    still be overridden with the `minsize` and `maxsize` URL parameters.
+    """
+    if not db_url:
+        return None
+    config = expand_db_url(db_url)
+    config["credentials"].setdefault("minsize", 5)
+    config["credentials"].setdefault("maxsize", 25)
+    return config
+
+
 TORTOISE_ORM = {
-    "connections": {"default": os.environ.get("BALLSDEXBOT_DB_URL")},
+    "connections": {"default": database_connection(os.environ.get("BALLSDEXBOT_DB_URL"))},
     "apps": {
         "models": {
             "models": ["ballsdex.core.models", "aerich.models"],
@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Iterable, Tuple, Type
 import discord
 from discord.utils import format_dt
 from fastapi_admin.models import AbstractAdmin
-from tortoise import exceptions, fields, models, signals, timezone, validators
+from tortoise import Tortoise, exceptions, fields, models, signals, timezone, validators
 from tortoise.expressions import Q
 
 from ballsdex.core.image_generator.image_gen import draw_card
@@ -437,14 +437,56 @@ class Player(models.Model):
         return str(self.discord_id)
 
     async def is_friend(self, other_player: "Player") -> bool:
-        return await Friendship.filter(
-            (Q(player1=self) & Q(player2=other_player))
-            | (Q(player1=other_player) & Q(player2=self))
-        ).exists()
+        player1, player2 = Friendship.ordered_pair(self, other_player)
+        return await Friendship.filter(player1=player1, player2=player2).exists()
 
     async def is_blocked(self, other_player: "Player") -> bool:
         return await Block.filter((Q(player1=self) & Q(player2=other_player))).exists()
 
+    async def relationship_state(self, other_player: "Player") -> tuple[bool, bool, bool]:
+        """
+        Fetch the friendship and block states between two players in a single query.
+
+        Returns
+        -------
+        tuple[bool, bool, bool]
+            Whether both players are friends, whether this player blocked the other one, and
+            whether the other player blocked this one.
+        """
+        low, high = Friendship.ordered_pair(self, other_player)
+        connection = Tortoise.get_connection("default")
+        _, rows = await connection.execute_query(
+            "SELECT "
+            "EXISTS(SELECT 1 FROM friendship "
+            "WHERE player1_id = $3 AND player2_id = $4) AS friend, "
+            "EXISTS(SELECT 1 FROM block WHERE player1_id = $1 AND player2_id = $2) AS blocked, "
+            "EXISTS(SELECT 1 FROM block WHERE player1_id = $2 AND player2_id = $1) AS blocked_by",
+            [self.pk, other_player.pk, low.pk, high.pk],
+        )
+        record = rows[0]
+        return record["friend"], record["blocked"], record["blocked_by"]
+
+    async def ball_counts(self) -> tuple[int, int, int, int]:
+        """
+        Count the instances owned by this player in a single query.
+
+        Returns
+        -------
+        tuple[int, int, int, int]
+            The number of instances owned, caught (not obtained by trade), shiny and special.
+        """
+        connection = Tortoise.get_connection("default")
+        _, rows = await connection.execute_query(
+            "SELECT COUNT(*) AS owned, "
+            "COUNT(*) FILTER (WHERE trade_player_id IS NULL) AS caught, "
+            "COUNT(*) FILTER (WHERE shiny) AS shiny, "
+            "COUNT(*) FILTER (WHERE special_id IS NOT NULL) AS special "
+            "FROM ballinstance WHERE player_id = $1",
+            [self.pk],
+        )
+        record = rows[0]
+        return record["owned"], record["caught"], record["shiny"], record["special"]
+
     @property
     def can_be_mentioned(self) -> bool:
         return self.mention_policy == MentionPolicy.ALLOW
@@ -494,6 +536,8 @@ class BlacklistHistory(models.Model):
 
 class Trade(models.Model):
     id: int
+    player1_id: int
+    player2_id: int
     player1: fields.ForeignKeyRelation[Player] = fields.ForeignKeyField(
         "models.Player", related_name="trades"
     )
@@ -509,6 +553,7 @@ class Trade(models.Model):
 
 class TradeObject(models.Model):
     trade_id: int
+    player_id: int
 
     trade: fields.ForeignKeyRelation[Trade] = fields.ForeignKeyField(
         "models.Trade", related_name="tradeobjects"
@@ -524,22 +569,55 @@ class TradeObject(models.Model):
         return str(self.pk)
 
 
+async def order_friendship_pair(
+    model: Type[Friendship],
+    instance: Friendship,
+    using_db: "BaseDBAsyncClient | None" = None,
+    update_fields: Iterable[str] | None = None,
+):
+    if instance.player1_id > instance.player2_id:
+        instance.player1, instance.player2 = instance.player2, instance.player1
+
+
 class Friendship(models.Model):
+    """
+    Friendships are symmetric and always stored with `player1_id < player2_id`, so that a pair
+    of players can be looked up with a single equality on the unique index.
+    """
+
     id: int
+    player1_id: int
+    player2_id: int
+
     player1: fields.ForeignKeyRelation[Player] = fields.ForeignKeyField(
         "models.Player", related_name="friend1"
     )
     player2: fields.ForeignKeyRelation[Player] = fields.ForeignKeyField(
-        "models.Player", related_name="friend2"
+        "models.Player", related_name="friend2", index=True
     )
     since = fields.DatetimeField(auto_now_add=True)
 
+    class Meta:
+        unique_together = ("player1", "player2")
+
     def __str__(self) -> str:
         return str(self.pk)
 
+    @staticmethod
+    def ordered_pair(player1: Player, player2: Player) -> tuple[Player, Player]:
+        if player1.pk > player2.pk:
+            return player2, player1
+        return player1, player2
+
+
+Friendship.register_listener(signals.Signals.pre_save, order_friendship_pair)
+
 
 class Block(models.Model):
     id: int
+    player1_id: int
+    player2_id: int
+
     player1: fields.ForeignKeyRelation[Player] = fields.ForeignKeyField(
         "models.Player", related_name="block1"
     )
@@ -548,5 +626,8 @@ class Block(models.Model):
     )
     date = fields.DatetimeField(auto_now_add=True)
 
+    class Meta:
+        unique_together = ("player1", "player2")
+
     def __str__(self) -> str:
         return str(self.pk)
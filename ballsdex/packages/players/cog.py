@@ -1,24 +1,18 @@
-import zipfile
-from io import BytesIO
+import asyncio
 from typing import TYPE_CHECKING
 
 import discord
+from cachetools import TTLCache
 from discord import app_commands
 from discord.ext import commands
 from discord.utils import format_dt
-from tortoise.exceptions import DoesNotExist
+from tortoise.exceptions import DoesNotExist, IntegrityError
 from tortoise.expressions import Q
+from tortoise.transactions import in_transaction
 
-from ballsdex.core.models import (
-    BallInstance,
-    Block,
-    DonationPolicy,
-    FriendPolicy,
-    Friendship,
-    MentionPolicy,
-)
+from ballsdex.core.models import Block, DonationPolicy, FriendPolicy, Friendship, MentionPolicy
 from ballsdex.core.models import Player as PlayerModel
-from ballsdex.core.models import PrivacyPolicy, Trade, TradeObject, balls
+from ballsdex.core.models import PrivacyPolicy, Trade, balls
 from ballsdex.core.utils.buttons import ConfirmChoiceView
 from ballsdex.core.utils.enums import (
     DONATION_POLICY_MAP,
@@ -32,6 +26,26 @@ from ballsdex.settings import settings
 if TYPE_CHECKING:
     from ballsdex.core.bot import BallsDexBot
 
+DONATION_POLICY_MESSAGES = {
+    DonationPolicy.ALWAYS_ACCEPT: (
+        "Setting updated, you will now receive all donated "
+        f"{settings.plural_collectible_name} immediately."
+    ),
+    DonationPolicy.REQUEST_APPROVAL: (
+        "Setting updated, you will now have to approve donation requests manually."
+    ),
+    DonationPolicy.ALWAYS_DENY: (
+        "Setting updated, it is now impossible to use "
+        f"`/{settings.players_group_cog_name} give` with "
+        "you. It is still possible to perform donations using the trade system."
+    ),
+    DonationPolicy.FRIENDS_ONLY: (
+        "Setting updated, you will now only receive donated "
+        f"{settings.plural_collectible_name} from players you have "
+        "added as friends in the bot."
+    ),
+}
+
 
 class Player(commands.GroupCog):
     """
@@ -41,11 +55,31 @@ class Player(commands.GroupCog):
     def __init__(self, bot: "BallsDexBot"):
         self.bot = bot
         self.active_friend_requests = {}
+        self.players: TTLCache[int, PlayerModel] = TTLCache(maxsize=10_000, ttl=60)
         if not self.bot.intents.members and self.__cog_app_commands_group__:
             privacy_command = self.__cog_app_commands_group__.get_command("privacy")
             if privacy_command:
                 privacy_command.parameters[0]._Parameter__parent.choices.pop()  # type: ignore
 
+    async def get_player(self, discord_id: int, *, refresh: bool = False) -> PlayerModel:
+        """
+        Get or create the player with the given Discord ID, caching it for a short time to
+        avoid hitting the database on every command.
+
+        Parameters
+        ----------
+        discord_id: int
+            The Discord ID of the player.
+        refresh: bool
+            Bypass the cache and fetch the row again. Use this before inserting rows referencing
+            the player, since it may have been edited or deleted from the admin panel.
+        """
+        player = None if refresh else self.players.get(discord_id)
+        if player is None:
+            player, _ = await PlayerModel.get_or_create(discord_id=discord_id)
+            self.players[discord_id] = player
+        return player
+
     friend = app_commands.Group(name="friend", description="Friend commands")
     blocked = app_commands.Group(name="block", description="Block commands")
     policy = app_commands.Group(name="policy", description="Policy commands")
@@ -68,14 +102,14 @@ class Player(commands.GroupCog):
         policy: PrivacyPolicy
             The new privacy policy to choose.
         """
-        player, _ = await PlayerModel.get_or_create(discord_id=interaction.user.id)
+        player = await self.get_player(interaction.user.id)
         if policy == PrivacyPolicy.SAME_SERVER and not self.bot.intents.members:
             await interaction.response.send_message(
                 "I need the `members` intent to use this policy.", ephemeral=True
             )
             return
         player.privacy_policy = PrivacyPolicy(policy.value)
-        await player.save()
+        await player.save(update_fields=["privacy_policy"])
         await interaction.response.send_message(
             f"Your privacy policy has been set to **{policy.name}**.", ephemeral=True
         )
@@ -102,37 +136,14 @@ class Player(commands.GroupCog):
         policy: DonationPolicy
             The new policy for accepting donations
         """
-        player, _ = await PlayerModel.get_or_create(discord_id=interaction.user.id)
-        player.donation_policy = DonationPolicy(policy.value)
-        if policy.value == DonationPolicy.ALWAYS_ACCEPT:
-            await interaction.response.send_message(
-                "Setting updated, you will now receive all donated "
-                f"{settings.plural_collectible_name} immediately.",
-                ephemeral=True,
-            )
-        elif policy.value == DonationPolicy.REQUEST_APPROVAL:
-            await interaction.response.send_message(
-                "Setting updated, you will now have to approve donation requests manually.",
-                ephemeral=True,
-            )
-        elif policy.value == DonationPolicy.ALWAYS_DENY:
-            await interaction.response.send_message(
-                "Setting updated, it is now impossible to use "
-                f"`/{settings.players_group_cog_name} give` with "
-                "you. It is still possible to perform donations using the trade system.",
-                ephemeral=True,
-            )
-        elif policy.value == DonationPolicy.FRIENDS_ONLY:
-            await interaction.response.send_message(
-                "Setting updated, you will now only receive donated "
-                f"{settings.plural_collectible_name} from players you have "
-                "added as friends in the bot.",
-                ephemeral=True,
-            )
-        else:
+        message = DONATION_POLICY_MESSAGES.get(policy.value)
+        if message is None:
             await interaction.response.send_message("Invalid input!", ephemeral=True)
             return
-        await player.save()  # do not save if the input is invalid
+        player = await self.get_player(interaction.user.id)
+        player.donation_policy = DonationPolicy(policy.value)
+        await interaction.response.send_message(message, ephemeral=True)
+        await player.save(update_fields=["donation_policy"])
 
     @policy.command()
     @app_commands.choices(
@@ -150,9 +161,9 @@ class Player(commands.GroupCog):
         policy: MentionPolicy
             The new policy for mentions
         """
-        player, _ = await PlayerModel.get_or_create(discord_id=interaction.user.id)
+        player = await self.get_player(interaction.user.id)
         player.mention_policy = policy
-        await player.save()
+        await player.save(update_fields=["mention_policy"])
         await interaction.response.send_message(
             f"Your mention policy has been set to **{policy.name.lower()}**.", ephemeral=True
         )
@@ -173,9 +184,9 @@ class Player(commands.GroupCog):
         policy: FriendPolicy
             The new policy for friend requests.
         """
-        player, _ = await PlayerModel.get_or_create(discord_id=interaction.user.id)
+        player = await self.get_player(interaction.user.id)
         player.friend_policy = policy
-        await player.save()
+        await player.save(update_fields=["friend_policy"])
         await interaction.response.send_message(
             f"Your friend request policy has been set to **{policy.name.lower()}**.",
             ephemeral=True,
@@ -193,8 +204,9 @@ class Player(commands.GroupCog):
         await view.wait()
         if view.value is None or not view.value:
             return
-        player, _ = await PlayerModel.get_or_create(discord_id=interaction.user.id)
+        player = await self.get_player(interaction.user.id)
         await player.delete()
+        self.players.pop(interaction.user.id, None)
 
     @friend.command(name="add")
     async def friend_add(self, interaction: discord.Interaction, user: discord.User):
@@ -206,10 +218,7 @@ class Player(commands.GroupCog):
         user: discord.User
             The user you want to add as a friend.
         """
-        player1, _ = await PlayerModel.get_or_create(discord_id=interaction.user.id)
-        player2, _ = await PlayerModel.get_or_create(discord_id=user.id)
-
-        if player1 == player2:
+        if user.id == interaction.user.id:
             await interaction.response.send_message(
                 "You cannot add yourself as a friend.", ephemeral=True
             )
@@ -217,19 +226,23 @@ class Player(commands.GroupCog):
         if user.bot:
             await interaction.response.send_message("You cannot add a bot.", ephemeral=True)
             return
-        if player2.discord_id in self.bot.blacklist:
+        if user.id in self.bot.blacklist:
             await interaction.response.send_message(
                 "You cannot add a blacklisted user as a friend.", ephemeral=True
             )
             return
+
+        player1, player2 = await asyncio.gather(
+            self.get_player(interaction.user.id, refresh=True),
+            self.get_player(user.id, refresh=True),
+        )
         if player2.friend_policy == FriendPolicy.DENY:
             await interaction.response.send_message(
                 "This user isn't accepting friend requests.", ephemeral=True
             )
             return
 
-        blocked = await player1.is_blocked(player2)
-        player2_blocked = await player2.is_blocked(player1)
+        friended, blocked, player2_blocked = await player1.relationship_state(player2)
 
         if blocked:
             player_unblock = self.block_remove.extras.get("mention", "/player block remove")
@@ -244,7 +257,6 @@ class Player(commands.GroupCog):
             )
             return
 
-        friended = await player1.is_friend(player2)
         if friended:
             await interaction.response.send_message(
                 "You are already friends with this user!", ephemeral=True
@@ -270,14 +282,19 @@ class Player(commands.GroupCog):
             allowed_mentions=discord.AllowedMentions(users=player2.can_be_mentioned),
         )
         self.active_friend_requests[(player1.discord_id, player2.discord_id)] = True
-        await view.wait()
-
-        if not view.value:
+        try:
+            await view.wait()
+            if not view.value:
+                return
+            try:
+                await Friendship.create(player1=player1, player2=player2)
+            except IntegrityError:
+                # both players accepted each other's request at the same time
+                await interaction.followup.send(
+                    "You are already friends with this user!", ephemeral=True
+                )
+        finally:
             self.active_friend_requests[(player1.discord_id, player2.discord_id)] = False
-            return
-
-        await Friendship.create(player1=player1, player2=player2)
-        self.active_friend_requests[(player1.discord_id, player2.discord_id)] = False
 
     @friend.command(name="remove")
     async def friend_remove(self, interaction: discord.Interaction, user: discord.User):
@@ -289,27 +306,25 @@ class Player(commands.GroupCog):
         user: discord.User
             The user you want to remove as a friend.
         """
-        player1, _ = await PlayerModel.get_or_create(discord_id=interaction.user.id)
-        player2, _ = await PlayerModel.get_or_create(discord_id=user.id)
-
-        if player1 == player2:
+        if user.id == interaction.user.id:
             await interaction.response.send_message("You cannot remove yourself.", ephemeral=True)
             return
         if user.bot:
             await interaction.response.send_message("You cannot remove a bot.", ephemeral=True)
             return
 
-        friendship_exists = await player1.is_friend(player2)
-        if not friendship_exists:
+        player1, player2 = await asyncio.gather(
+            self.get_player(interaction.user.id), self.get_player(user.id)
+        )
+
+        low, high = Friendship.ordered_pair(player1, player2)
+        deleted = await Friendship.filter(player1=low, player2=high).delete()
+        if not deleted:
             await interaction.response.send_message(
                 "You are not friends with this user.", ephemeral=True
             )
             return
         else:
-            await Friendship.filter(
-                (Q(player1=player1) & Q(player2=player2))
-                | (Q(player1=player2) & Q(player2=player1))
-            ).delete()
             await interaction.response.send_message(
                 f"{user.name} has been removed as a friend.", ephemeral=True
             )
@@ -319,14 +334,14 @@ class Player(commands.GroupCog):
         """
         View all your friends.
         """
-        player, _ = await PlayerModel.get_or_create(discord_id=interaction.user.id)
+        player = await self.get_player(interaction.user.id)
 
-        friendships = (
-            await Friendship.filter(Q(player1=player) | Q(player2=player))
-            .select_related("player1", "player2")
-            .order_by("since")
-            .all()
+        # two single-column lookups instead of an OR, each one served by its own index
+        as_player1, as_player2 = await asyncio.gather(
+            Friendship.filter(player1_id=player.pk).select_related("player2"),
+            Friendship.filter(player2_id=player.pk).select_related("player1"),
         )
+        friendships = sorted(as_player1 + as_player2, key=lambda x: x.since)
 
         if not friendships:
             await interaction.response.send_message(
@@ -337,7 +352,7 @@ class Player(commands.GroupCog):
         entries: list[tuple[str, str]] = []
 
         for idx, relation in enumerate(friendships, start=1):
-            if relation.player1 == player:
+            if relation.player1_id == player.pk:
                 friend = relation.player2
             else:
                 friend = relation.player1
@@ -365,30 +380,30 @@ class Player(commands.GroupCog):
         user: discord.User
             The user you want to block.
         """
-        player1, _ = await PlayerModel.get_or_create(discord_id=interaction.user.id)
-        player2, _ = await PlayerModel.get_or_create(discord_id=user.id)
-
-        await interaction.response.defer(ephemeral=True, thinking=True)
-
-        if player1 == player2:
-            await interaction.followup.send("You cannot block yourself.", ephemeral=True)
+        if user.id == interaction.user.id:
+            await interaction.response.send_message("You cannot block yourself.", ephemeral=True)
             return
         if user.bot:
-            await interaction.followup.send("You cannot block a bot.", ephemeral=True)
-            return
-
-        blocked = await player1.is_blocked(player2)
-        if blocked:
-            await interaction.followup.send("You have already blocked this user.", ephemeral=True)
+            await interaction.response.send_message("You cannot block a bot.", ephemeral=True)
             return
-        if self.active_friend_requests[(player1.discord_id, player2.discord_id)]:
-            await interaction.followup.send(
+        if self.active_friend_requests.get((interaction.user.id, user.id), False):
+            await interaction.response.send_message(
                 "You cannot block a user to whom you have sent an active friend request.",
                 ephemeral=True,
             )
             return
 
-        friended = await player1.is_friend(player2)
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        player1, player2 = await asyncio.gather(
+            self.get_player(interaction.user.id, refresh=True),
+            self.get_player(user.id, refresh=True),
+        )
+
+        friended, blocked, _ = await player1.relationship_state(player2)
+        if blocked:
+            await interaction.followup.send("You have already blocked this user.", ephemeral=True)
+            return
+
         if friended:
             view = ConfirmChoiceView(
                 interaction,
@@ -404,13 +419,19 @@ class Player(commands.GroupCog):
 
             if not view.value:
                 return
-            else:
-                await Friendship.filter(
-                    (Q(player1=player1) & Q(player2=player2))
-                    | (Q(player1=player2) & Q(player2=player1))
-                ).delete()
 
-        await Block.create(player1=player1, player2=player2)
+        # removing the friendship and creating the block must succeed or fail together
+        try:
+            async with in_transaction() as connection:
+                if friended:
+                    low, high = Friendship.ordered_pair(player1, player2)
+                    friendship = Friendship.filter(player1=low, player2=high)
+                    await friendship.using_db(connection).delete()
+                await Block.create(player1=player1, player2=player2, using_db=connection)
+        except IntegrityError:
+            # another block command for this user completed while this one was waiting
+            await interaction.followup.send("You have already blocked this user.", ephemeral=True)
+            return
         await interaction.followup.send(f"You have now blocked {user.name}.", ephemeral=True)
 
     @blocked.command(name="remove")
@@ -423,23 +444,23 @@ class Player(commands.GroupCog):
         user: discord.User
             The user you want to unblock.
         """
-        player1, _ = await PlayerModel.get_or_create(discord_id=interaction.user.id)
-        player2, _ = await PlayerModel.get_or_create(discord_id=user.id)
-
-        if player1 == player2:
+        if user.id == interaction.user.id:
             await interaction.response.send_message("You cannot unblock yourself.", ephemeral=True)
             return
         if user.bot:
             await interaction.response.send_message("You cannot unblock a bot.", ephemeral=True)
             return
 
-        blocked = await player1.is_blocked(player2)
+        player1, player2 = await asyncio.gather(
+            self.get_player(interaction.user.id), self.get_player(user.id)
+        )
+
+        deleted = await Block.filter(player1=player1, player2=player2).delete()
 
-        if not blocked:
+        if not deleted:
             await interaction.response.send_message("This user isn't blocked.", ephemeral=True)
             return
         else:
-            await Block.filter((Q(player1=player1) & Q(player2=player2))).delete()
             await interaction.response.send_message(
                 f"{user.name} has been unblocked.", ephemeral=True
             )
@@ -449,13 +470,10 @@ class Player(commands.GroupCog):
         """
         View all the users you have blocked.
         """
-        player, _ = await PlayerModel.get_or_create(discord_id=interaction.user.id)
+        player = await self.get_player(interaction.user.id)
 
         blocked_relations = (
-            await Block.filter(player1=player)
-            .select_related("player1", "player2")
-            .order_by("date")
-            .all()
+            await Block.filter(player1=player).select_related("player2").order_by("date").all()
         )
 
         if not blocked_relations:
@@ -467,11 +485,7 @@ class Player(commands.GroupCog):
         entries: list[tuple[str, str]] = []
 
         for idx, relation in enumerate(blocked_relations, start=1):
-            if relation.player1 == player:
-                blocked_user = relation.player2
-            else:
-                blocked_user = relation.player1
-
+            blocked_user = relation.player2
             since = format_dt(relation.date, style="f")
             entries.append(
                 (
@@ -496,14 +510,10 @@ class Player(commands.GroupCog):
         """
         await interaction.response.defer(thinking=True, ephemeral=True)
         try:
-            player = await PlayerModel.get(discord_id=interaction.user.id).prefetch_related(
-                "balls"
-            )
+            player = await PlayerModel.get(discord_id=interaction.user.id)
         except DoesNotExist:
             await interaction.followup.send("You haven't got any info to show!", ephemeral=True)
             return
-        ball = await BallInstance.filter(player=player).prefetch_related("special", "trade_player")
-
         user = interaction.user
         bot_countryballs = {x: y.emoji_id for x, y in balls.items() if y.enabled}
         total_countryballs = len(bot_countryballs)
@@ -519,20 +529,14 @@ class Player(commands.GroupCog):
             )
         else:
             completion_percentage = "0.0%"
-        caught_owned = [x for x in ball if x.trade_player is None]
-        balls_owned = [x for x in ball]
-        shiny = [x for x in ball if x.shiny is True]
-        special = [x for x in ball if x.special is not None]
-        trades = await Trade.filter(
-            Q(player1__discord_id=interaction.user.id) | Q(player2__discord_id=interaction.user.id)
-        ).count()
-        friends = await Friendship.filter(
-            Q(player1__discord_id=interaction.user.id) | Q(player2__discord_id=interaction.user.id)
-        ).count()
-
-        blocks = await Block.filter(
-            Q(player1__discord_id=interaction.user.id) | Q(player2__discord_id=interaction.user.id)
-        ).count()
+        (balls_owned, caught_owned, shiny, special), trades, friends, blocks = (
+            await asyncio.gather(
+                player.ball_counts(),
+                Trade.filter(Q(player1=player) | Q(player2=player)).count(),
+                Friendship.filter(Q(player1=player) | Q(player2=player)).count(),
+                Block.filter(Q(player1=player) | Q(player2=player)).count(),
+            )
+        )
 
         embed = discord.Embed(
             title=f"**{user.display_name.title()}'s {settings.bot_name.title()} Info**",
@@ -549,10 +553,10 @@ class Player(commands.GroupCog):
             f"**Amount of Blocked Users:** {blocks}\n"
             "## Player Stats\n"
             f"**Completion:** {completion_percentage}\n"
-            f"**{settings.collectible_name.title()}s Owned:** {len(balls_owned):,}\n"
-            f"**Caught {settings.collectible_name.title()}s Owned**: {len(caught_owned):,}\n"
-            f"**Shiny {settings.collectible_name.title()}s:** {len(shiny):,}\n"
-            f"**Special {settings.collectible_name.title()}s:** {len(special):,}\n"
+            f"**{settings.collectible_name.title()}s Owned:** {balls_owned:,}\n"
+            f"**Caught {settings.collectible_name.title()}s Owned**: {caught_owned:,}\n"
+            f"**Shiny {settings.collectible_name.title()}s:** {shiny:,}\n"
+            f"**Special {settings.collectible_name.title()}s:** {special:,}\n"
             f"**Trades Completed:** {trades:,}"
         )
         embed.set_footer(text="Keep collecting and trading to improve your stats!")
@@ -578,95 +582,44 @@ class Player(commands.GroupCog):
             )
             return
         await interaction.response.defer()
-        files = []
+        # only loaded when needed, this is rarely used
+        from ballsdex.packages.players.export import build_zip, get_items_csv, get_trades_csv
+
+        balls_filename = f"{interaction.user.id}_{settings.collectible_name}.csv"
+        trades_filename = f"{interaction.user.id}_trades.csv"
+        files: list[tuple[str, bytes]] = []
         if type == "balls":
-            data = await get_items_csv(player)
-            filename = f"{interaction.user.id}_{settings.collectible_name}.csv"
-            data.filename = filename  # type: ignore
-            files.append(data)
+            files.append((balls_filename, await get_items_csv(player)))
         elif type == "trades":
-            data = await get_trades_csv(player)
-            filename = f"{interaction.user.id}_trades.csv"
-            data.filename = filename  # type: ignore
-            files.append(data)
+            files.append((trades_filename, await get_trades_csv(player)))
         elif type == "all":
-            balls = await get_items_csv(player)
-            trades = await get_trades_csv(player)
-            balls_filename = f"{interaction.user.id}_{settings.collectible_name}.csv"
-            trades_filename = f"{interaction.user.id}_trades.csv"
-            balls.filename = balls_filename  # type: ignore
-            trades.filename = trades_filename  # type: ignore
-            files.append(balls)
-            files.append(trades)
+            balls, trades = await asyncio.gather(get_items_csv(player), get_trades_csv(player))
+            files.append((balls_filename, balls))
+            files.append((trades_filename, trades))
         else:
             await interaction.followup.send("Invalid input!", ephemeral=True)
             return
-        zip_file = BytesIO()
-        with zipfile.ZipFile(zip_file, "w") as z:
-            for file in files:
-                z.writestr(file.filename, file.getvalue())
-        zip_file.seek(0)
-        if zip_file.tell() > 25_000_000:
-            await interaction.followup.send(
-                "Your data is too large to export."
-                "Please contact the bot support for more information.",
-                ephemeral=True,
-            )
-            return
-        files = [discord.File(zip_file, "player_data.zip")]
-        try:
-            await interaction.user.send("Here is your player data:", files=files)
-            await interaction.followup.send(
-                "Your player data has been sent via DMs.", ephemeral=True
-            )
-        except discord.Forbidden:
-            await interaction.followup.send(
-                "I couldn't send the player data to you in DM. "
-                "Either you blocked me or you disabled DMs in this server.",
-                ephemeral=True,
-            )
-
-
-async def get_items_csv(player: PlayerModel) -> BytesIO:
-    """
-    Get a CSV file with all items of the player.
-    """
-    balls = await BallInstance.filter(player=player).prefetch_related(
-        "ball", "trade_player", "special"
-    )
-    txt = (
-        f"id,hex id,{settings.collectible_name},catch date,trade_player"
-        ",special,shiny,attack,attack bonus,hp,hp_bonus\n"
-    )
-    for ball in balls:
-        txt += (
-            f"{ball.id},{ball.id:0X},{ball.ball.country},{ball.catch_date},"  # type: ignore
-            f"{ball.trade_player.discord_id if ball.trade_player else 'None'},{ball.special},"
-            f"{ball.shiny},{ball.attack},{ball.attack_bonus},{ball.health},{ball.health_bonus}\n"
-        )
-    return BytesIO(txt.encode("utf-8"))
-
-
-async def get_trades_csv(player: PlayerModel) -> BytesIO:
-    """
-    Get a CSV file with all trades of the player.
-    """
-    trade_history = (
-        await Trade.filter(Q(player1=player) | Q(player2=player))
-        .order_by("date")
-        .prefetch_related("player1", "player2")
-    )
-    txt = "id,date,player1,player2,player1 received,player2 received\n"
-    for trade in trade_history:
-        player1_items = await TradeObject.filter(
-            trade=trade, player=trade.player1
-        ).prefetch_related("ballinstance")
-        player2_items = await TradeObject.filter(
-            trade=trade, player=trade.player2
-        ).prefetch_related("ballinstance")
-        txt += (
-            f"{trade.id},{trade.date},{trade.player1.discord_id},{trade.player2.discord_id},"
-            f"{','.join([i.ballinstance.to_string() for i in player2_items])},"  # type: ignore
-            f"{','.join([i.ballinstance.to_string() for i in player1_items])}\n"  # type: ignore
-        )
-    return BytesIO(txt.encode("utf-8"))
+        # compression is CPU-bound, keep it off the event loop
+        zip_file = await asyncio.to_thread(build_zip, files)
+        with zip_file:
+            if zip_file.tell() > 25_000_000:
+                await interaction.followup.send(
+                    "Your data is too large to export."
+                    "Please contact the bot support for more information.",
+                    ephemeral=True,
+                )
+                return
+            zip_file.seek(0)
+            try:
+                await interaction.user.send(
+                    "Here is your player data:", file=discord.File(zip_file, "player_data.zip")
+                )
+                await interaction.followup.send(
+                    "Your player data has been sent via DMs.", ephemeral=True
+                )
+            except discord.Forbidden:
+                await interaction.followup.send(
+                    "I couldn't send the player data to you in DM. "
+                    "Either you blocked me or you disabled DMs in this server.",
+                    ephemeral=True,
+                )
@@ -0,0 +1,182 @@
+import asyncio
+import csv
+import zipfile
+from collections import defaultdict
+from io import BytesIO, TextIOWrapper
+from tempfile import SpooledTemporaryFile
+from typing import TYPE_CHECKING
+
+from tortoise.expressions import Q
+
+from ballsdex.core.models import BallInstance, Player, Trade, TradeObject
+from ballsdex.settings import settings
+
+if TYPE_CHECKING:
+    from _csv import _writer
+
+EXPORT_CHUNK_SIZE = 5000
+
+
+def build_zip(files: list[tuple[str, bytes]]) -> SpooledTemporaryFile:
+    """
+    Compress the given CSV files into a ZIP archive.
+    """
+    # only spills to disk for unusually large exports
+    zip_file = SpooledTemporaryFile(max_size=26_000_000)
+    with zipfile.ZipFile(zip_file, "w", zipfile.ZIP_DEFLATED, compresslevel=6) as z:
+        for name, payload in files:
+            z.writestr(name, payload)
+    return zip_file
+
+
+def write_items_rows(writer: "_writer", rows: list[tuple]):
+    """
+    Write a chunk of rows fetched by `get_items_csv` to the CSV writer.
+    """
+    # attack and health are computed the same way as BallInstance.attack/health
+    writer.writerows(
+        (
+            instance_id,
+            f"{instance_id:0X}",
+            country,
+            catch_date,
+            "None" if trade_player is None else trade_player,
+            "None" if special is None else special,
+            shiny,
+            attack + int(attack * attack_bonus * 0.01),
+            attack_bonus,
+            health + int(health * health_bonus * 0.01),
+            health_bonus,
+        )
+        for (
+            instance_id,
+            country,
+            catch_date,
+            trade_player,
+            special,
+            shiny,
+            attack,
+            attack_bonus,
+            health,
+            health_bonus,
+        ) in rows
+    )
+
+
+async def get_items_csv(player: Player) -> bytes:
+    """
+    Get a CSV file with all items of the player.
+    """
+    buffer = BytesIO()
+    wrapper = TextIOWrapper(buffer, encoding="utf-8", newline="", write_through=True)
+    writer = csv.writer(wrapper)
+    writer.writerow(
+        (
+            "id",
+            "hex id",
+            settings.collectible_name,
+            "catch date",
+            "trade_player",
+            "special",
+            "shiny",
+            "attack",
+            "attack bonus",
+            "hp",
+            "hp_bonus",
+        )
+    )
+    last_id = 0
+    while True:
+        # fetch by chunks to keep memory bounded for very large inventories
+        # plain tuples are much cheaper to build than model instances
+        rows = (
+            await BallInstance.filter(player=player, id__gt=last_id)
+            .order_by("id")
+            .limit(EXPORT_CHUNK_SIZE)
+            .values_list(
+                "id",
+                "ball__country",
+                "catch_date",
+                "trade_player__discord_id",
+                "special__name",
+                "shiny",
+                "ball__attack",
+                "attack_bonus",
+                "ball__health",
+                "health_bonus",
+            )
+        )
+        if not rows:
+            break
+        # formatting is done in a thread to avoid blocking the event loop
+        await asyncio.to_thread(write_items_rows, writer, rows)
+        last_id = rows[-1][0]
+    wrapper.detach()  # keep the underlying buffer open
+    return buffer.getvalue()
+
+
+def format_trades_csv(trade_history: list[tuple], trade_objects: list[tuple]) -> bytes:
+    """
+    Format the rows fetched by `get_trades_csv` into a CSV file.
+    """
+    # format every traded instance in a single pass, mirroring BallInstance.to_string()
+    grouped: dict[tuple[int, int], list[str]] = defaultdict(list)
+    for (
+        trade_id,
+        player_id,
+        instance_id,
+        favorite,
+        shiny,
+        special_emoji,
+        country,
+    ) in trade_objects:
+        emotes = ("❤️" if favorite else "") + ("✨" if shiny else "")
+        if emotes:
+            emotes += " "
+        if special_emoji:
+            emotes += "⚡ " if special_emoji.isdigit() else f"{special_emoji} "
+        grouped[(trade_id, player_id)].append(f"{emotes}#{instance_id:0X} {country}")
+    buffer = BytesIO()
+    wrapper = TextIOWrapper(buffer, encoding="utf-8", newline="", write_through=True)
+    writer = csv.writer(wrapper)
+    writer.writerow(("id", "date", "player1", "player2", "player1 received", "player2 received"))
+    writer.writerows(
+        (
+            trade_id,
+            date,
+            player1_discord_id,
+            player2_discord_id,
+            ",".join(grouped[(trade_id, player2_id)]),
+            ",".join(grouped[(trade_id, player1_id)]),
+        )
+        for trade_id, date, player1_id, player2_id, player1_discord_id, player2_discord_id in (
+            trade_history
+        )
+    )
+    wrapper.detach()  # keep the underlying buffer open
+    return buffer.getvalue()
+
+
+async def get_trades_csv(player: Player) -> bytes:
+    """
+    Get a CSV file with all trades of the player.
+    """
+    trade_history = (
+        await Trade.filter(Q(player1=player) | Q(player2=player))
+        .order_by("date")
+        .values_list(
+            "id", "date", "player1_id", "player2_id", "player1__discord_id", "player2__discord_id"
+        )
+    )
+    trade_objects = await TradeObject.filter(
+        Q(trade__player1=player) | Q(trade__player2=player)
+    ).values_list(
+        "trade_id",
+        "player_id",
+        "ballinstance_id",
+        "ballinstance__favorite",
+        "ballinstance__shiny",
+        "ballinstance__special__emoji",
+        "ballinstance__ball__country",
+    )
+    return await asyncio.to_thread(format_trades_csv, trade_history, trade_objects)
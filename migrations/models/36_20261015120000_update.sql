@@ -0,0 +1,14 @@
+-- upgrade --
+DELETE FROM "friendship" a USING "friendship" b
+    WHERE a."id" > b."id"
+    AND LEAST(a."player1_id", a."player2_id") = LEAST(b."player1_id", b."player2_id")
+    AND GREATEST(a."player1_id", a."player2_id") = GREATEST(b."player1_id", b."player2_id");
+UPDATE "friendship" SET "player1_id" = "player2_id", "player2_id" = "player1_id"
+    WHERE "player1_id" > "player2_id";
+CREATE UNIQUE INDEX "uid_friendship_player1_89ee4e" ON "friendship" ("player1_id", "player2_id");
+DELETE FROM "block" a USING "block" b
+    WHERE a."id" > b."id" AND a."player1_id" = b."player1_id" AND a."player2_id" = b."player2_id";
+CREATE UNIQUE INDEX "uid_block_player1_99c570" ON "block" ("player1_id", "player2_id");
+-- downgrade --
+DROP INDEX IF EXISTS "uid_friendship_player1_89ee4e";
+DROP INDEX IF EXISTS "uid_block_player1_99c570";
@@ -0,0 +1,4 @@
+-- upgrade --
+CREATE INDEX "idx_friendship_player2_5d2a55" ON "friendship" ("player2_id");
+-- downgrade --
+DROP INDEX IF EXISTS "idx_friendship_player2_5d2a55";